@@ -25,13 +25,11 @@
 #   pomodoro skip         # Skip to next (break or pomodoro)
 #   pomodoro reset        # Reset current timer
 
-import argparse
-import asyncio
 import sys
 
-from dbus_fast.aio import MessageBus
-from dbus_fast import Message, MessageType
-from math import floor, ceil
+# asyncio and the D-Bus bindings are imported lazily inside the functions
+# that use them so that one-shot commands, --help and argument errors don't
+# pay for loading them.
 
 
 SERVICE_NAME = 'org.gnome.Pomodoro'
@@ -39,24 +37,58 @@ OBJECT_PATH = '/org/gnome/Pomodoro'
 INTERFACE_NAME = 'org.gnome.Pomodoro'
 PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
 
+COMMAND_METHODS = {
+    'start': 'Start',
+    'stop': 'Stop',
+    'pause': 'Pause',
+    'resume': 'Resume',
+    'skip': 'Skip',
+    'reset': 'Reset',
+}
+
+COMMANDS = (*COMMAND_METHODS, 'status')
+
+PROPERTIES_CHANGED = 'PropertiesChanged'
 PROPERTIES_CHANGED_MATCH = (
     f"type='signal',interface='{PROPERTIES_INTERFACE}',"
-    f"member='PropertiesChanged',path='{OBJECT_PATH}'"
+    f"member='{PROPERTIES_CHANGED}',path='{OBJECT_PATH}'"
 )
 
+# Seconds to wait after a PropertiesChanged signal before re-reading state
+WATCH_DEBOUNCE = 0.05
+
+# A Message can't be reused (dbus-fast assigns its serial on send), so only
+# the constructor arguments are shared between GetAll calls.
+_GET_ALL_MSG_ARGS = dict(
+    destination=SERVICE_NAME,
+    path=OBJECT_PATH,
+    interface=PROPERTIES_INTERFACE,
+    member='GetAll',
+    signature='s',
+    body=[INTERFACE_NAME],
+)
+
+
+# Output templates keyed on (hours > 0, minutes > 0)
+_TIME_FORMATS = {
+    (True, True): '{0}h {1}m',
+    (True, False): '{0}h',
+    (False, True): '{1}m {2}s',
+    (False, False): '{2}s',
+}
+
+# Output prefix per timer state; any other state prints 'Stopped'
+_STATE_PREFIXES = {
+    'pomodoro': 'Pomodoro ',
+    'short-break': 'Break ',
+    'long-break': 'Break ',
+}
+
 
 def format_time(seconds):
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    parts = []
-    seconds = seconds % 60
-    if hours > 0:
-        parts.append(f'{hours}h')
-    if minutes > 0:
-        parts.append(f'{minutes}m')
-    if hours == 0:
-        parts.append(f'{seconds}s')
-    return ' '.join(parts)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return _TIME_FORMATS[hours > 0, minutes > 0].format(hours, minutes, seconds)
 
 
 def _unwrap_variant(val):
@@ -71,98 +103,89 @@ def parse_timer_state(data):
     return result
 
 
-def print_state_from_data(data):
-    """Print timer state from properties dict."""
-    elapsed = floor(data.get('Elapsed', 0) or 0)
-    state_duration = data.get('StateDuration') or 0
-    remaining = ceil(state_duration - elapsed)
+def print_state_from_data(data, last=None):
+    """Print timer state from properties dict.
+
+    Returns a key describing what was printed; pass it back as ``last`` to
+    skip printing when the visible state has not changed.
+    """
+    # Elapsed is non-negative, so int() floors it; remaining is rounded up
+    elapsed = int(data.get('Elapsed') or 0)
+    remaining_f = (data.get('StateDuration') or 0) - elapsed
+    remaining = int(remaining_f)
+    remaining += remaining_f > remaining
     is_paused = data.get('IsPaused', False)
     state = data.get('State') or 'null'
 
+    key = (state, remaining, is_paused, elapsed == 0)
+    if key == last:
+        return key
+
     if is_paused and elapsed == 0 and state == 'pomodoro':
         print('Break Over!')
-        return
+        return key
 
-    if is_paused:
-        remaining_string = 'Paused'
+    prefix = _STATE_PREFIXES.get(state)
+    if prefix is None:
+        print('Stopped')
+    elif is_paused:
+        print(f'{prefix}Paused')
     else:
-        remaining_string = format_time(int(remaining))
-
-    match state:
-        case 'pomodoro':
-            print(f'Pomodoro {remaining_string}')
-        case 'short-break':
-            print(f'Break {remaining_string}')
-        case 'long-break':
-            print(f'Break {remaining_string}')
-        case _:
-            print('Stopped')
+        # Elapsed can briefly overrun StateDuration at an interval boundary
+        print(f'{prefix}{format_time(max(remaining, 0))}')
+    return key
 
 
 async def get_properties(bus):
     """Get all Pomodoro properties via D-Bus."""
-    msg = Message(
-        destination=SERVICE_NAME,
-        path=OBJECT_PATH,
-        interface=PROPERTIES_INTERFACE,
-        member='GetAll',
-        signature='s',
-        body=[INTERFACE_NAME],
-    )
-    reply = await bus.call(msg)
+    from dbus_fast import Message, MessageType
+
+    reply = await bus.call(Message(**_GET_ALL_MSG_ARGS))
     if reply.message_type == MessageType.ERROR:
         raise Exception(reply.body[0] if reply.body else 'Unknown error')
     return parse_timer_state(reply.body[0])
 
 
-async def call_pomodoro_method(bus, method: str):
-    """Call a method on org.gnome.Pomodoro."""
-    msg = Message(
-        destination=SERVICE_NAME,
-        path=OBJECT_PATH,
-        interface=INTERFACE_NAME,
-        member=method,
-        signature='',
-        body=[],
-    )
-    reply = await bus.call(msg)
-    if reply.message_type == MessageType.ERROR:
+def call_pomodoro_method(method: str):
+    """Call a method on org.gnome.Pomodoro over a blocking connection."""
+    from jeepney import DBusAddress, new_method_call, MessageType
+    from jeepney.io.blocking import open_dbus_connection
+
+    address = DBusAddress(OBJECT_PATH, bus_name=SERVICE_NAME, interface=INTERFACE_NAME)
+    with open_dbus_connection(bus='SESSION') as conn:
+        reply = conn.send_and_get_reply(new_method_call(address, method))
+    if reply.header.message_type == MessageType.error:
         raise Exception(reply.body[0] if reply.body else 'Unknown error')
 
 
-async def run_command_async(command: str) -> bool:
+def run_command(command: str) -> bool:
     """Execute a command and return True on success."""
+    method = COMMAND_METHODS.get(command)
+    if method is None:
+        return False
     try:
-        bus = MessageBus()
-        await bus.connect()
-        if command == 'start':
-            await call_pomodoro_method(bus, 'Start')
-        elif command == 'stop':
-            await call_pomodoro_method(bus, 'Stop')
-        elif command == 'pause':
-            await call_pomodoro_method(bus, 'Pause')
-        elif command == 'resume':
-            await call_pomodoro_method(bus, 'Resume')
-        elif command == 'skip':
-            await call_pomodoro_method(bus, 'Skip')
-        elif command == 'reset':
-            await call_pomodoro_method(bus, 'Reset')
-        else:
-            return False
-        bus.disconnect()
+        call_pomodoro_method(method)
         return True
     except Exception as e:
         print(f'Error: {e}', file=sys.stderr)
         return False
 
 
-def run_command(command: str) -> bool:
-    """Execute a command (sync wrapper)."""
-    return asyncio.run(run_command_async(command))
+def run_async(coro):
+    """Run a coroutine, using uvloop when it is installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 async def status_async():
     """Print current status once."""
+    from dbus_fast.aio import MessageBus
+
     bus = MessageBus()
     await bus.connect()
     try:
@@ -174,6 +197,11 @@ async def status_async():
 
 async def watch_async():
     """Watch mode: print state and update on changes."""
+    import asyncio
+
+    from dbus_fast.aio import MessageBus
+    from dbus_fast import Message, MessageType
+
     bus = MessageBus()
     await bus.connect()
 
@@ -186,32 +214,31 @@ async def watch_async():
         signature='s',
         body=[PROPERTIES_CHANGED_MATCH],
     )
-    await bus.call(add_match_msg)
-
-    # Print initial state
-    data = await get_properties(bus)
-    print_state_from_data(data)
+    # Subscribe and fetch the initial state in parallel
+    _, data = await asyncio.gather(bus.call(add_match_msg), get_properties(bus))
+    last_printed = print_state_from_data(data)
 
     loop = asyncio.get_event_loop()
     update_event = asyncio.Event()
 
     def message_handler(msg):
-        if (msg.message_type == MessageType.SIGNAL and
-                msg.interface == PROPERTIES_INTERFACE and
-                msg.member == 'PropertiesChanged' and
-                msg.path == OBJECT_PATH):
+        # The AddMatch rule already restricts signals to our path/interface
+        if msg.message_type == MessageType.SIGNAL and msg.member == PROPERTIES_CHANGED:
             loop.call_soon(update_event.set)
         return None
 
     bus.add_message_handler(message_handler)
 
     async def watch_loop():
+        nonlocal last_printed
         while True:
             await update_event.wait()
+            # Let a burst of signals pile up and answer it with one GetAll
+            await asyncio.sleep(WATCH_DEBOUNCE)
             update_event.clear()
             try:
                 data = await get_properties(bus)
-                print_state_from_data(data)
+                last_printed = print_state_from_data(data, last_printed)
             except Exception:
                 pass
 
@@ -230,31 +257,47 @@ async def watch_async():
         bus.disconnect()
 
 
-def main():
+def _build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='CLI para GNOME Pomodoro. Sin argumentos, muestra el estado en tiempo real.'
     )
     parser.add_argument(
         'command',
         nargs='?',
-        choices=['start', 'stop', 'pause', 'resume', 'skip', 'reset', 'status'],
-        help='Comando a ejecutar: start, stop, pause, resume, skip, reset, status'
+        choices=COMMANDS,
+        help='Comando a ejecutar: ' + ', '.join(COMMANDS)
     )
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_command(argv):
+    """Return the requested command, or None for watch mode."""
+    # Fast path: skip argparse for the common invocations
+    if not argv:
+        return None
+    if len(argv) == 1 and argv[0] in COMMANDS:
+        return argv[0]
+    return _build_parser().parse_args(argv).command
+
+
+def main():
+    command = _parse_command(sys.argv[1:])
 
-    if args.command:
-        if args.command == 'status':
-            asyncio.run(status_async())
+    if command:
+        if command == 'status':
+            run_async(status_async())
         else:
-            if run_command(args.command):
-                print(f'OK: {args.command}')
+            if run_command(command):
+                print(f'OK: {command}')
             else:
                 sys.exit(1)
         return
 
     # Watch mode
     try:
-        asyncio.run(watch_async())
+        run_async(watch_async())
     except KeyboardInterrupt:
         pass
 